@@ -3,13 +3,28 @@ Alphatronics UNii Unit Tests
 """
 
 import asyncio
+import json
 import logging
+from functools import lru_cache
 
 logging.basicConfig(
     format="%(asctime)s %(levelname)-8s %(filename)s:%(lineno)d %(message)s",
     level=logging.DEBUG,
 )
 
+_SETTINGS_JSON = "settings.json"
+
+
+@lru_cache
+def load_settings() -> dict:
+    """
+    Loads the test settings.
+
+    The settings are read and parsed only once and shared by all test cases.
+    """
+    with open(_SETTINGS_JSON, encoding="utf8") as settings_file:
+        return json.load(settings_file)
+
 
 def async_test(coro):
     """
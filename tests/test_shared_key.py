@@ -3,15 +3,12 @@ Tests encrypted connection to Alphatronics UNii.
 """
 
 import asyncio
-import json
 import logging
 import unittest
 
 from unii import DEFAULT_PORT, UNiiLocal
 
-from . import async_test
-
-_SETTINGS_JSON = "settings.json"
+from . import async_test, load_settings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,10 +25,9 @@ class Test(unittest.TestCase):
         # logging.basicConfig(
         #     format="%(asctime)s %(levelname)-8s %(message)s", level=logging.DEBUG
         # )
-        with open(_SETTINGS_JSON, encoding="utf8") as settings_file:
-            settings = json.load(settings_file)
-            self._host = settings.get("host")
-            self._port = settings.get("encrypted_port", self._port)
+        settings = load_settings()
+        self._host = settings.get("host")
+        self._port = settings.get("encrypted_port", self._port)
 
     @async_test
     async def test_connect_byte_array(self):
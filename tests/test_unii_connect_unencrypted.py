@@ -5,15 +5,12 @@ Tests unencrypted connection to Alphatronics UNii.
 """
 
 import asyncio
-import json
 import logging
 import unittest
 
 from unii import UNiiLocal
 
-from . import async_test
-
-_SETTINGS_JSON = "settings.json"
+from . import async_test, load_settings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,10 +24,9 @@ class Test(unittest.TestCase):
     _port: int = 6502
 
     def setUp(self):
-        with open(_SETTINGS_JSON, encoding="utf8") as settings_file:
-            settings = json.load(settings_file)
-            self._host = settings.get("host")
-            self._port = settings.get("unencrypted_port", self._port)
+        settings = load_settings()
+        self._host = settings.get("host")
+        self._port = settings.get("unencrypted_port", self._port)
 
     def test_create_unii_object(self):
         """
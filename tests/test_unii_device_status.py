@@ -3,15 +3,12 @@
 Test Device Status.
 """
 import asyncio
-import json
 import logging
 import unittest
 
 from unii import UNiiLocal
 
-from . import async_test
-
-_SETTINGS_JSON = "settings.json"
+from . import async_test, load_settings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,13 +21,12 @@ class Test(unittest.TestCase):
     _unii = None
 
     def setUp(self):
-        with open(_SETTINGS_JSON, encoding="utf8") as settings_file:
-            settings = json.load(settings_file)
-            host = settings.get("host")
-            port = settings.get("encrypted_port", 6502)
-            shared_key = settings.get("shared_key", 6502)
+        settings = load_settings()
+        host = settings.get("host")
+        port = settings.get("encrypted_port", 6502)
+        shared_key = settings.get("shared_key", 6502)
 
-            self._unii = UNiiLocal(host, port, shared_key)
+        self._unii = UNiiLocal(host, port, shared_key)
 
     @async_test
     async def test_device_status(self):
@@ -42,7 +38,7 @@ class Test(unittest.TestCase):
             result = await self._unii.connect()
             self.assertTrue(result, "Failed to connect to UNii")
             self.assertIsNotNone(self._unii.device_status, "Device Status not set")
-            _LOGGER.debug(self._unii.device_status)
+            _LOGGER.debug("%s", self._unii.device_status)
             self.assertEqual(len(self._unii.device_status.io_devices), 15)
             self.assertEqual(len(self._unii.device_status.keyboard_devices), 16)
             self.assertEqual(len(self._unii.device_status.wiegand_devices), 16)
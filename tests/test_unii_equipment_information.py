@@ -3,15 +3,12 @@
 Test Equipment Information.
 """
 import asyncio
-import json
 import logging
 import unittest
 
 from unii import UNiiLocal
 
-from . import async_test
-
-_SETTINGS_JSON = "settings.json"
+from . import async_test, load_settings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,13 +27,12 @@ class Test(unittest.TestCase):
     _unii = None
 
     def setUp(self):
-        with open(_SETTINGS_JSON, encoding="utf8") as settings_file:
-            settings = json.load(settings_file)
-            host = settings.get("host")
-            port = settings.get("encrypted_port", 6502)
-            shared_key = settings.get("shared_key", 6502)
+        settings = load_settings()
+        host = settings.get("host")
+        port = settings.get("encrypted_port", 6502)
+        shared_key = settings.get("shared_key", 6502)
 
-            self._unii = UNiiLocal(host, port, shared_key)
+        self._unii = UNiiLocal(host, port, shared_key)
 
     @async_test
     async def test_equipment_information(self):
@@ -48,7 +44,7 @@ class Test(unittest.TestCase):
             result = await self._unii.connect()
             self.assertTrue(result, "Failed to connect to UNii")
             self.assertIsNotNone(self._unii.equipment_information)
-            _LOGGER.debug(self._unii.equipment_information)
+            _LOGGER.debug("%s", self._unii.equipment_information)
             self.assertEqual(
                 self._unii.equipment_information.device_name,
                 "Unii",
@@ -4,13 +4,12 @@
 Test Input Status.
 """
 import asyncio
-import json
 import logging
 import unittest
 
 from unii import UNiiInputState, UNiiLocal
 
-_SETTINGS_JSON = "settings.json"
+from . import load_settings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,17 +22,16 @@ class Test(unittest.IsolatedAsyncioTestCase):
     _unii = None
 
     async def asyncSetUp(self):
-        with open(_SETTINGS_JSON, encoding="utf8") as settings_file:
-            settings = json.load(settings_file)
-            host = settings.get("host")
-            port = settings.get("encrypted_port", 6502)
-            shared_key = settings.get("shared_key", 6502)
-            self.user_code = settings.get("user_code", "123456")
+        settings = load_settings()
+        host = settings.get("host")
+        port = settings.get("encrypted_port", 6502)
+        shared_key = settings.get("shared_key", 6502)
+        self.user_code = settings.get("user_code", "123456")
 
-            self._unii = UNiiLocal(host, port, shared_key)
-            await asyncio.sleep(1)
-            result = await self._unii.connect()
-            self.assertTrue(result, "Failed to connect to UNii")
+        self._unii = UNiiLocal(host, port, shared_key)
+        await asyncio.sleep(1)
+        result = await self._unii.connect()
+        self.assertTrue(result, "Failed to connect to UNii")
 
     async def asyncTearDown(self):
         await asyncio.sleep(1)
@@ -46,34 +44,34 @@ class Test(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(self._unii.inputs, "Input Status not set")
         for _, unii_input in self._unii.inputs.items():
             if unii_input.status != UNiiInputState.DISABLED:
-                _LOGGER.info(unii_input)
-
-    async def test_bypass_wired_input(self):
-        await self._unii.unbypass_input(2, self.user_code)
-        result = await self._unii.bypass_input(2, self.user_code)
-        self.assertTrue(result, "Failed to bypass input")
-
-    async def test_bypass_wired_input_fail(self):
-        await self._unii.unbypass_input(2, self.user_code)
-        result = await self._unii.bypass_input(2, "")
-        self.assertFalse(result)
-
-    async def test_unbypass_wired_input(self):
-        await self._unii.bypass_input(2, self.user_code)
-        result = await self._unii.unbypass_input(2, self.user_code)
-        self.assertTrue(result, "Failed to bypass input")
-
-    async def test_unbypass_wired_input_fail(self):
-        await self._unii.bypass_input(2, self.user_code)
-        result = await self._unii.unbypass_input(2, "")
-        self.assertFalse(result)
+                _LOGGER.info("%s", unii_input)
 
-    async def test_bypass_keypad_input(self):
-        await self._unii.unbypass_input(701, self.user_code)
-        result = await self._unii.bypass_input(701, self.user_code)
-        self.assertTrue(result, "Failed to bypass input")
+    async def test_bypass_input(self):
+        """
+        Tests bypassing a wired (2) and a keypad (701) input.
 
-    async def test_bypass_keypad_input_fail(self):
-        await self._unii.unbypass_input(701, self.user_code)
-        result = await self._unii.bypass_input(701, "")
-        self.assertFalse(result)
+        Each input is brought to the unbypassed starting state once; the failing attempt with
+        an invalid user code leaves that state untouched, so the successful attempt can reuse
+        it without another reset round-trip.
+        """
+        for input_number in [2, 701]:
+            await self._unii.unbypass_input(input_number, self.user_code)
+            with self.subTest(input_number=input_number, user_code=""):
+                result = await self._unii.bypass_input(input_number, "")
+                self.assertFalse(result)
+            with self.subTest(input_number=input_number):
+                result = await self._unii.bypass_input(input_number, self.user_code)
+                self.assertTrue(result, "Failed to bypass input")
+
+    async def test_unbypass_input(self):
+        """
+        Tests unbypassing a wired (2) input, starting from the bypassed state.
+        """
+        for input_number in [2]:
+            await self._unii.bypass_input(input_number, self.user_code)
+            with self.subTest(input_number=input_number, user_code=""):
+                result = await self._unii.unbypass_input(input_number, "")
+                self.assertFalse(result)
+            with self.subTest(input_number=input_number):
+                result = await self._unii.unbypass_input(input_number, self.user_code)
+                self.assertTrue(result, "Failed to unbypass input")
@@ -3,15 +3,12 @@
 Test Input Status.
 """
 import asyncio
-import json
 import logging
 import unittest
 
 from unii import UNiiLocal
 
-from . import async_test
-
-_SETTINGS_JSON = "settings.json"
+from . import async_test, load_settings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,13 +21,12 @@ class Test(unittest.TestCase):
     _unii = None
 
     def setUp(self):
-        with open(_SETTINGS_JSON, encoding="utf8") as settings_file:
-            settings = json.load(settings_file)
-            host = settings.get("host")
-            port = settings.get("encrypted_port", 6502)
-            shared_key = settings.get("shared_key", 6502)
+        settings = load_settings()
+        host = settings.get("host")
+        port = settings.get("encrypted_port", 6502)
+        shared_key = settings.get("shared_key", 6502)
 
-            self._unii = UNiiLocal(host, port, shared_key)
+        self._unii = UNiiLocal(host, port, shared_key)
 
     @async_test
     async def test_outputs(self):
@@ -43,7 +39,7 @@ class Test(unittest.TestCase):
             self.assertTrue(result, "Failed to connect to UNii")
             self.assertIsNotNone(self._unii.outputs, "Output Status not set")
             for _, unii_output in self._unii.outputs.items():
-                _LOGGER.info(unii_output)
+                _LOGGER.info("%s", unii_output)
         finally:
             await asyncio.sleep(1)
             await self._unii.disconnect()
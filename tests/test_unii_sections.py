@@ -3,15 +3,12 @@
 Test Input Status.
 """
 import asyncio
-import json
 import logging
 import unittest
 
 from unii import UNiiLocal
 
-from . import async_test
-
-_SETTINGS_JSON = "settings.json"
+from . import async_test, load_settings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,14 +22,13 @@ class Test(unittest.TestCase):
     user_code = None
 
     def setUp(self):
-        with open(_SETTINGS_JSON, encoding="utf8") as settings_file:
-            settings = json.load(settings_file)
-            host = settings.get("host")
-            port = settings.get("encrypted_port", 6502)
-            shared_key = settings.get("shared_key", 6502)
-            self.user_code = settings.get("user_code", "000000")
+        settings = load_settings()
+        host = settings.get("host")
+        port = settings.get("encrypted_port", 6502)
+        shared_key = settings.get("shared_key", 6502)
+        self.user_code = settings.get("user_code", "000000")
 
-            self._unii = UNiiLocal(host, port, shared_key)
+        self._unii = UNiiLocal(host, port, shared_key)
 
     @async_test
     async def test_sections(self):
@@ -45,7 +41,7 @@ class Test(unittest.TestCase):
             self.assertTrue(result, "Failed to connect to UNii")
             self.assertIsNotNone(self._unii.sections, "Sections not set")
             for _, section in self._unii.sections.items():
-                _LOGGER.info(section)
+                _LOGGER.info("%s", section)
         finally:
             await asyncio.sleep(1)
             await self._unii.disconnect()
@@ -8,8 +8,8 @@ import asyncio
 import logging
 import time
 from abc import ABC
-from datetime import datetime, timedelta
 from enum import IntFlag, auto
+from functools import cache
 from typing import Any, Final
 
 from .task_helper import save_task_reference
@@ -24,7 +24,22 @@ from .unii_connection import (
 
 logger = logging.getLogger(__name__)
 
-_POLL_ALIVE_INTERVAL: Final = timedelta(seconds=30)
+# Poll alive interval in seconds.
+_POLL_ALIVE_INTERVAL: Final = 30.0
+
+# Section numbers 1 to 32, to request the status of all sections at once.
+_SECTION_STATUS_ALL_SECTIONS: Final = bytes(range(1, 33))
+
+
+@cache
+def _block_payload(block: int) -> UNiiRawData:
+    """
+    Payload to request the given block of an input or output arrangement.
+
+    The block numbers are the same small integers on every (re)connect, so the payloads are
+    built only once.
+    """
+    return UNiiRawData(block.to_bytes(2))
 
 
 class UNiiEncryptionError(Exception):
@@ -49,34 +64,57 @@ class UNii(ABC):
     UNii base class for interfacing with Alphatronics UNii security systems.
     """
 
-    unique_id: str | None = None
-    model: str = "Unknown"
-    connected: bool = False
-
-    equipment_information: UNiiEquipmentInformation | None = None
+    # Instances are long lived and their attributes are accessed on every received frame,
+    # __slots__ makes the attribute access a fixed offset load and drops the per-instance
+    # __dict__.
+    __slots__ = (
+        "unique_id",
+        "model",
+        "connected",
+        "equipment_information",
+        "sections",
+        "inputs",
+        "outputs",
+        "device_status",
+        "connection",
+        "features",
+        "_event_occurred_callbacks",
+    )
+
+    unique_id: str | None
+    model: str
+    connected: bool
+
+    equipment_information: UNiiEquipmentInformation | None
     sections: dict[int, UNiiSection]
     inputs: dict[int, UNiiInput]
     outputs: dict[int, UNiiOutput]
-    device_status: UNiiDeviceStatus | None = None
+    device_status: UNiiDeviceStatus | None
 
     connection: UNiiConnection
 
-    features: list[UNiiFeature]
+    features: UNiiFeature
 
-    _event_occurred_callbacks: list[Any]
+    _event_occurred_callbacks: tuple[Any, ...]
 
     def __init__(
         self,
     ):
         super().__init__()
 
+        self.unique_id = None
+        self.model = "Unknown"
+        self.connected = False
+
+        self.equipment_information = None
         self.sections = {}
         self.inputs = {}
         self.outputs = {}
+        self.device_status = None
 
-        self.features = []
+        self.features = UNiiFeature(0)
 
-        self._event_occurred_callbacks = []
+        self._event_occurred_callbacks = ()
 
     async def test_connection(self) -> bool:
         """
@@ -106,7 +144,9 @@ class UNii(ABC):
         """
         Adds an Event Occurred Callback to the UNii.
         """
-        self._event_occurred_callbacks.append(callback)
+        # The callbacks are kept in a tuple which is replaced on registration, so the dispatch
+        # loop always iterates an immutable snapshot.
+        self._event_occurred_callbacks = (*self._event_occurred_callbacks, callback)
 
     def _forward_to_event_occurred_callbacks(
         self, command: UNiiCommand, data: UNiiData | None
@@ -142,26 +182,64 @@ class UNiiLocal(UNii):
     network.
     """
 
-    _received_message_queue: dict[int, list[Any]]
-    _waiting_for_message: dict[int, UNiiCommand | None]
+    __slots__ = (
+        "_waiting_for_message",
+        "_reconnect_lock",
+        "_event_queue",
+        "_message_handlers",
+        "_poll_alive_task",
+        "_event_dispatcher_task",
+        "_supports_output_arrangement",
+    )
+
+    # Futures for pending request/response exchanges, keyed by TX sequence number. Each entry
+    # holds the expected response command and the future the response is delivered on.
+    _waiting_for_message: dict[int, list[Any]]
 
-    _poll_alive_task: asyncio.Task | None = None
+    _poll_alive_task: asyncio.Task | None
+    _event_dispatcher_task: asyncio.Task | None
+
+    # Whether the equipment supports the Request Output Arrangement command, derived from the
+    # firmware version when the Equipment Information is received.
+    _supports_output_arrangement: bool
 
     def __init__(
         self, host: str, port: int = DEFAULT_PORT, shared_key: bytes | None = None
     ):
         super().__init__()
 
+        self._poll_alive_task = None
+        self._event_dispatcher_task = None
+        self._supports_output_arrangement = False
+
         # If the shared key is provided as hex string convert it to bytes.
         if shared_key is not None and isinstance(shared_key, str):
             shared_key = bytes.fromhex(shared_key)
         self.connection = UNiiTCPConnection(host, port, shared_key)
+        self.connection.set_connection_closed_callback(self._connection_closed)
         self.unique_id = f"{host}:{port}"
 
-        self._received_message_queue = {}
         self._waiting_for_message = {}
 
-        self._received_message_queue_lock = asyncio.Lock()
+        # Serializes reconnect attempts, so concurrent sends on a closed connection don't all
+        # run the connection handshake.
+        self._reconnect_lock = asyncio.Lock()
+
+        # Queue on which received events are handed over to the event dispatcher task, so slow
+        # Event Occurred Callbacks don't stall the receive coroutine.
+        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+
+        # Handlers for received messages, keyed by command. Event Occurred messages are
+        # handled separately because they have to be acknowledged.
+        self._message_handlers = {
+            UNiiCommand.INPUT_STATUS_CHANGED: self._handle_input_status_changed,
+            UNiiCommand.INPUT_STATUS_UPDATE: self._handle_input_status_update,
+            UNiiCommand.DEVICE_STATUS_CHANGED: self._handle_device_status_changed,
+            UNiiCommand.RESPONSE_REQUEST_SECTION_ARRANGEMENT: self._handle_section_arrangement,
+            UNiiCommand.RESPONSE_REQUEST_SECTION_STATUS: self._handle_section_status,
+            UNiiCommand.RESPONSE_REQUEST_INPUT_ARRANGEMENT: self._handle_input_arrangement,
+            UNiiCommand.RESPONSE_REQUEST_EQUIPMENT_INFORMATION: self._handle_equipment_information,
+        }
 
     async def test_connection(self) -> bool:
         success = False
@@ -241,11 +319,7 @@ class UNiiLocal(UNii):
 
             await self._send_receive(
                 UNiiCommand.REQUEST_SECTION_STATUS,
-                UNiiRawData(
-                    bytes.fromhex(
-                        "0102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f20"
-                    )
-                ),
+                UNiiRawData(_SECTION_STATUS_ALL_SECTIONS),
                 UNiiCommand.RESPONSE_REQUEST_SECTION_STATUS,
                 False,
             )
@@ -255,7 +329,7 @@ class UNiiLocal(UNii):
                 block += 1
                 _, data = await self._send_receive(
                     UNiiCommand.REQUEST_INPUT_ARRANGEMENT,
-                    UNiiRawData(block.to_bytes(2)),
+                    _block_payload(block),
                     UNiiCommand.RESPONSE_REQUEST_INPUT_ARRANGEMENT,
                     False,
                 )
@@ -269,16 +343,13 @@ class UNiiLocal(UNii):
                 False,
             )
 
-            software_version = (
-                self.equipment_information.software_version.finalize_version()
-            )
-            if software_version.match(">=2.17.0"):
+            if self._supports_output_arrangement:
                 block = 0
                 while True:
                     block += 1
                     _, data = await self._send_receive(
                         UNiiCommand.REQUEST_OUTPUT_ARRANGEMENT,
-                        UNiiRawData(block.to_bytes(2)),
+                        _block_payload(block),
                         UNiiCommand.RESPONSE_REQUEST_OUTPUT_ARRANGEMENT,
                         False,
                     )
@@ -304,6 +375,10 @@ class UNiiLocal(UNii):
     async def connect(self) -> bool:
         try:
             if await self._connect():
+                self._event_dispatcher_task = asyncio.create_task(
+                    self._event_dispatcher_coroutine()
+                )
+                save_task_reference(self._event_dispatcher_task)
                 self._poll_alive_task = asyncio.create_task(
                     self._poll_alive_coroutine()
                 )
@@ -333,6 +408,9 @@ class UNiiLocal(UNii):
 
     async def disconnect(self) -> bool:
         await self._cancel_poll_alive()
+        # Cancel the event dispatcher first so the Normal Disconnect event is forwarded to the
+        # callbacks directly instead of being left behind on the queue.
+        await self._cancel_event_dispatcher()
 
         if self.connection is not None and self.connection.is_open:
             try:
@@ -342,23 +420,22 @@ class UNiiLocal(UNii):
                 logger.error(str(ex))
                 return False
 
-        if self._poll_alive_task is not None:
-            await self._cancel_poll_alive()
         return True
 
     async def _send(
         self, command: UNiiCommand, data: UNiiData | None = None, reconnect: bool = True
     ) -> int | None:
         try:
-            if self.connection is None and reconnect:
-                logger.info("Trying to connect")
-                await self._connect()
-            elif not self.connection.is_open and reconnect:
-                logger.info("Trying to reconnect")
-                await self._connect()
-            elif self.connection is None or not self.connection.is_open:
-                # ToDo: Throw exception?
-                return None
+            if self.connection is None or not self.connection.is_open:
+                if not reconnect:
+                    # ToDo: Throw exception?
+                    return None
+                async with self._reconnect_lock:
+                    # Another send can have reconnected while waiting for the lock, don't
+                    # run the connection handshake again in that case.
+                    if self.connection is None or not self.connection.is_open:
+                        logger.info("Trying to reconnect")
+                        await self._connect()
 
             # logger.debug("Sending command %s", command)
             return await self.connection.send(command, data)
@@ -389,12 +466,15 @@ class UNiiLocal(UNii):
 
         self.equipment_information = data
 
-        # Set the supported features of the equipment
-        self.features = []
+        # Parsing and matching the firmware version is relatively expensive, do it once here
+        # instead of on every (re)connect.
+        self._supports_output_arrangement = (
+            data.software_version.finalize_version().match(">=2.17.0")
+        )
 
-        # Feature that applies to all versions of the firmware
-        self.features.append(UNiiFeature.BYPASS_INPUT)
-        self.features.append(UNiiFeature.ARM_SECTION)
+        # Set the supported features of the equipment
+        # Features that apply to all versions of the firmware
+        self.features = UNiiFeature.BYPASS_INPUT | UNiiFeature.ARM_SECTION
 
         # Get capabilities based on firmware version number
         # Library doesn't distinct between versions yet, so disabled for now
@@ -402,18 +482,19 @@ class UNiiLocal(UNii):
         #     self.equipment_information.software_version.finalize_version()
         # )
         # if software_version.match(">=2.17.0"):
-        #     self.features.append(UNiiFeature.BYPASS_ZONE)
-        #     self.features.append(UNiiFeature.SET_OUTPUT)
+        #     self.features |= UNiiFeature.BYPASS_ZONE
+        #     self.features |= UNiiFeature.SET_OUTPUT
 
     def _handle_section_arrangement(self, data: UNiiSectionArrangement):
-        for _, section in data.items():
-            if section.number not in self.sections and section.active:
+        for section in data.values():
+            existing_section = self.sections.get(section.number)
+            if existing_section is not None:
+                existing_section.update(section)
+            elif section.active:
                 self.sections[section.number] = section
-            elif section.number in self.sections:
-                self.sections[section.number].update(section)
 
     def _handle_section_status(self, data: UNiiSectionStatus):
-        for _, section_status in data.items():
+        for section_status in data.values():
             if section_status.number in self.sections:
                 section_status["active"] = (
                     section_status.armed_state != UNiiSectionArmedState.NOT_PROGRAMMED
@@ -433,75 +514,142 @@ class UNiiLocal(UNii):
             logger.warning("Status for unknown input %i changed", input_status.number)
 
     def _handle_input_status_changed(self, data: UNiiInputStatus):
-        for _, input_status in data.items():
-            self._handle_input_status_update(input_status)
+        handle_input_status_update = self._handle_input_status_update
+        for input_status in data.values():
+            handle_input_status_update(input_status)
+
+    def _handle_device_status_changed(self, data: UNiiDeviceStatus):
+        self.device_status = data
 
     def _handle_input_arrangement(self, data: UNiiInputArrangement):
         if data is None:
             return
-        for _, unii_input in data.items():
+        # Bind the lookup dicts to locals outside the loop, a panel can have hundreds of
+        # inputs each listing several sections.
+        sections = self.sections
+        inputs = self.inputs
+        for unii_input in data.values():
             # Expand sections
-            for index, section in enumerate(unii_input.sections):
-                unii_input["sections"][index] = self.sections[section]
+            unii_input["sections"] = [
+                sections[section] for section in unii_input.sections
+            ]
 
-            if unii_input.number not in self.inputs:
-                self.inputs[unii_input.number] = unii_input
+            existing_input = inputs.get(unii_input.number)
+            if existing_input is None:
+                inputs[unii_input.number] = unii_input
             else:
                 # Retain the input status before updating the input with new data.
-                unii_input.status = self.inputs[unii_input.number].status
-                self.inputs[unii_input.number].update(unii_input)
+                unii_input.status = existing_input.status
+                existing_input.update(unii_input)
+
+    def _forward_to_event_occurred_callbacks(
+        self, command: UNiiCommand, data: UNiiData | None
+    ):
+        if self._event_dispatcher_task is None or self._event_dispatcher_task.done():
+            # No event dispatcher is running, e.g. while connecting or disconnecting, run the
+            # callbacks directly.
+            super()._forward_to_event_occurred_callbacks(command, data)
+            return
+
+        try:
+            self._event_queue.put_nowait((command, data))
+        except asyncio.QueueFull:
+            logger.warning("Event queue is full, event %s is dropped", command)
+
+    async def _event_dispatcher_coroutine(self):
+        # Runs the Event Occurred Callbacks outside the receive coroutine, so a slow callback
+        # can not stall frame processing.
+        while True:
+            try:
+                command, data = await self._event_queue.get()
+                super()._forward_to_event_occurred_callbacks(command, data)
+            except asyncio.CancelledError:
+                logger.debug("Event dispatcher coroutine was canceled")
+                break
+
+    async def _cancel_event_dispatcher(self) -> bool:
+        if self._event_dispatcher_task is not None and not (
+            self._event_dispatcher_task.done()
+            or self._event_dispatcher_task.cancelled()
+        ):
+            self._event_dispatcher_task.cancel()
+            try:
+                await self._event_dispatcher_task
+            except asyncio.CancelledError:
+                logger.debug("Event dispatcher task was cancelled")
+                self._event_dispatcher_task = None
+
+        if (
+            self._event_dispatcher_task is not None
+            and not self._event_dispatcher_task.done()
+        ):
+            logger.error("Failed to cancel event dispatcher task")
+            logger.debug("Event dispatcher task: %s", self._event_dispatcher_task)
+            return False
+
+        self._event_dispatcher_task = None
+
+        # Deliver the events which were still queued when the dispatcher was cancelled,
+        # they were received before the disconnect and must not be lost.
+        while not self._event_queue.empty():
+            command, data = self._event_queue.get_nowait()
+            super()._forward_to_event_occurred_callbacks(command, data)
+
+        return True
 
     async def _message_received_callback(
         self, tx_sequence: int, command: UNiiCommand, data: UNiiData
     ):
-        match command:
-            case UNiiCommand.EVENT_OCCURRED:
-                self._forward_to_event_occurred_callbacks(command, data)
-                if self.connected:
-                    try:
-                        await self._send(
-                            UNiiCommand.RESPONSE_EVENT_OCCURRED, None, False
-                        )
-                    except UNiiEncryptionError:
-                        pass
-            case UNiiCommand.INPUT_STATUS_CHANGED:
-                self._handle_input_status_changed(data)
-            case UNiiCommand.INPUT_STATUS_UPDATE:
-                self._handle_input_status_update(data)
-            case UNiiCommand.DEVICE_STATUS_CHANGED:
-                self.device_status = data
-            case UNiiCommand.RESPONSE_REQUEST_SECTION_ARRANGEMENT:
-                self._handle_section_arrangement(data)
-            case UNiiCommand.RESPONSE_REQUEST_SECTION_STATUS:
-                self._handle_section_status(data)
-            case UNiiCommand.RESPONSE_REQUEST_INPUT_ARRANGEMENT:
-                self._handle_input_arrangement(data)
-            case UNiiCommand.RESPONSE_REQUEST_EQUIPMENT_INFORMATION:
-                self._handle_equipment_information(data)
-
-        if tx_sequence in self._waiting_for_message and self._waiting_for_message[
-            tx_sequence
-        ] in [None, command]:
-            async with self._received_message_queue_lock:
-                self._received_message_queue[tx_sequence] = [command, data]
+        if command == UNiiCommand.EVENT_OCCURRED:
+            if self.connected:
+                # The protocol requires one acknowledge per event, but the receive path
+                # doesn't have to wait for the write to complete before processing the
+                # next frame.
+                ack_task = asyncio.create_task(self._acknowledge_event_occurred())
+                save_task_reference(ack_task)
+        else:
+            handler = self._message_handlers.get(command)
+            if handler is not None:
+                handler(data)
+
+        waiting = self._waiting_for_message.get(tx_sequence)
+        if waiting is not None:
+            expected_response, future = waiting
+            if (
+                expected_response is None or expected_response == command
+            ) and not future.done():
+                future.set_result([command, data])
 
         self._forward_to_event_occurred_callbacks(command, data)
 
+    def _connection_closed(self):
+        # Fail the pending response waits right away, otherwise every in-flight request
+        # would block for its full timeout after the connection dropped.
+        for waiting in self._waiting_for_message.values():
+            future = waiting[1]
+            if not future.done():
+                future.set_result([None, None])
+
+    async def _acknowledge_event_occurred(self):
+        try:
+            await self._send(UNiiCommand.RESPONSE_EVENT_OCCURRED, None, False)
+        except UNiiEncryptionError:
+            pass
+
     async def _get_received_message(
         self, tx_sequence: int, expected_response: UNiiCommand | None = None
     ) -> list[Any]:
-        timeout = time.time() + 5
-        self._waiting_for_message[tx_sequence] = expected_response
-        while self.connection.is_open and time.time() < timeout:
-            async with self._received_message_queue_lock:
-                if tx_sequence in self._received_message_queue:
-                    return self._received_message_queue.pop(tx_sequence)
-            # logger.debug("Waiting for message %i to be received", tx_sequence)
-            await asyncio.sleep(0.1)
-
-        logger.error("Message %i was not received", tx_sequence)
-        del self._waiting_for_message[tx_sequence]
-        return [None, None]
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._waiting_for_message[tx_sequence] = [expected_response, future]
+        try:
+            # The future is resolved by _message_received_callback as soon as the response
+            # arrives, no polling is involved.
+            return await asyncio.wait_for(future, timeout=5)
+        except TimeoutError:
+            logger.error("Message %i was not received", tx_sequence)
+            return [None, None]
+        finally:
+            self._waiting_for_message.pop(tx_sequence, None)
 
     async def _poll_alive(self) -> bool:
         try:
@@ -547,14 +695,22 @@ class UNiiLocal(UNii):
         """
         while True:
             try:
-                if (
-                    not self.connection.is_open
-                    or datetime.now()
-                    > self.connection.last_message_sent + _POLL_ALIVE_INTERVAL
-                ) and not await self._poll_alive():
+                if self.connection.is_open:
+                    # Sleep until the poll alive interval has passed since the last sent
+                    # message instead of waking up every second just to check the clock.
+                    sleep_for = (
+                        self.connection.last_message_sent
+                        + _POLL_ALIVE_INTERVAL
+                        - time.monotonic()
+                    )
+                    if sleep_for > 0:
+                        await asyncio.sleep(sleep_for)
+                        continue
+                if not await self._poll_alive():
                     if self.connection.is_open:
                         await self._disconnect()
-                await asyncio.sleep(1)
+                    # Keep the original 1 second pacing for the retry/reconnect path.
+                    await asyncio.sleep(1)
             except asyncio.CancelledError:
                 logger.debug("Poll alive coroutine was canceled")
                 break
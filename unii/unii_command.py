@@ -77,3 +77,10 @@ class UNiiCommand(IntEnum):
 
     def __repr__(self) -> str:
         return self.name
+
+
+# Lookup table to resolve raw command codes to UNiiCommand members without the overhead of the
+# enum constructor, which runs for every received message.
+COMMANDS_BY_VALUE: Final[dict[int, UNiiCommand]] = {
+    command.value: command for command in UNiiCommand
+}
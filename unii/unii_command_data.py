@@ -5,6 +5,7 @@ Data classes used by the UNii library.
 
 import logging
 import string
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import IntEnum, IntFlag, auto
@@ -25,31 +26,26 @@ def bit_position_to_numeric(data: bytes) -> list[int]:
 
     00001010 => [2, 4]
     """
-    data = int.from_bytes(data)
+    value = int.from_bytes(data)
     numerics = []
-    for i in range(0, 31):
-        bit_position: int = pow(2, i)
-        if data & bit_position:
-            numerics.append(i + 1)
+    while value:
+        # Isolate the lowest set bit, its bit length is the 1-based bit position.
+        lowest_bit = value & -value
+        numerics.append(lowest_bit.bit_length())
+        value ^= lowest_bit
     return numerics
 
 
 def bcd_encode(data: str) -> bytes:
-    """ "
+    """
     Encodes numeric string values in BCD format padded with zeroes to the right.
 
     https://en.wikipedia.org/wiki/Binary-coded_decimal
-
-    Example implementation from:
     """
     assert data.isdigit()
 
-    # Add trailing zeroes
-    while len(data) < 16:
-        data += "0"
-    logger.debug("Data: %s", data)
-
-    return bytes.fromhex(data)
+    # Add trailing zeroes, two digits are packed into each of the 8 bytes.
+    return bytes.fromhex(data.ljust(16, "0"))
 
 
 def decode_and_strip(data: bytes) -> str:
@@ -104,6 +100,8 @@ class UNiiData(ABC):
     All data classes which are used to send or receive data should inherit from this class.
     """
 
+    __slots__ = ()
+
 
 class UNiiSendData(ABC):
     # pylint: disable=too-few-public-methods
@@ -111,6 +109,8 @@ class UNiiSendData(ABC):
     Method which should be implemented by data classes which are used to send data.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def to_bytes(self):
         """
@@ -128,6 +128,8 @@ class UNiiRawData(UNiiData, UNiiSendData):
     used when no other data classes are available.
     """
 
+    __slots__ = ("raw_data",)
+
     def __init__(self, raw_data):
         self.raw_data = raw_data
 
@@ -166,6 +168,19 @@ class UNiiEquipmentInformation(UNiiData):
     This data class contains the response of the "Request Equipment Information" command.
     """
 
+    __slots__ = (
+        "software_version",
+        "software_date",
+        "device_name",
+        "max_inputs",
+        "max_groups",
+        "max_sections",
+        "max_users",
+        "device_id",
+        "serial_number",
+        "mac_address",
+    )
+
     def __init__(self, data: bytes):
         # pylint: disable=consider-using-min-builtin
         # pylint: disable=too-many-locals
@@ -356,6 +371,8 @@ class UNiiArmDisarmSection(UNiiData, UNiiSendData):
     This data class contains the request for "Request Arm Section" and "Request Disarm Section"
     """
 
+    __slots__ = ("code", "number")
+
     def __init__(self, code: str, number: int):
         self.code = code
         self.number = number
@@ -396,6 +413,8 @@ class UNiiReadyToArmSectionStatus(UNiiData):
     UNii Ready To Arm Section State data class
     """
 
+    __slots__ = ("section_number", "section_state")
+
     def __init__(self, data: bytes):
         self.section_number = data[0]
         self.section_state = data[1]
@@ -425,6 +444,8 @@ class UNiiArmSectionStatus(UNiiData):
     UNii Arm Section State data class
     """
 
+    __slots__ = ("number", "arm_state")
+
     def __init__(self, data: bytes):
         self.number = data[0]
         self.arm_state = UNiiArmState(data[1])
@@ -457,6 +478,8 @@ class UNiiDisarmSectionStatus(UNiiData):
     UNii Disarm Section State data class
     """
 
+    __slots__ = ("number", "disarm_state")
+
     def __init__(self, data: bytes):
         self.number = data[0]
         self.disarm_state = UNiiDisarmState(data[1])
@@ -696,6 +719,8 @@ class UNiiBypassUnbypassZoneInput(UNiiData, UNiiSendData):
     Unbypass a Zone/Input".
     """
 
+    __slots__ = ("mode", "code", "number")
+
     def __init__(self, mode: UNiiBypassMode, code: str, number: int):
         self.mode = mode
         self.code = code[:8].ljust(8, "0")
@@ -714,6 +739,9 @@ class UNiiBypassZoneInputResult(UNiiData):
     """
     Result of bypassing a zone or input.
     """
+
+    __slots__ = ("number", "result")
+
     NOT_PROGRAMMED = 0
     SUCCESSFUL = 1
     AUTHENTICATION_FAILED = 2
@@ -732,6 +760,9 @@ class UNiiUnbypassZoneInputResult(UNiiData):
     """
     Result of unbypassing a zone or input.
     """
+
+    __slots__ = ("number", "result")
+
     NOT_PROGRAMMED = 0
     SUCCESSFUL = 1
     AUTHENTICATION_FAILED = 2
@@ -854,6 +885,16 @@ class UNiiDeviceStatus(UNiiData):
     This data class contains the response of the "Request Device Status" command.
     """
 
+    __slots__ = (
+        "control_panel",
+        "io_devices",
+        "keyboard_devices",
+        "wiegand_devices",
+        "knx_device",
+        "uwi_devices",
+        "redundant_device",
+    )
+
     io_devices: list[UNiiDeviceStatusRecord]
     keyboard_devices: list[UNiiDeviceStatusRecord]
     wiegand_devices: list[UNiiDeviceStatusRecord]
@@ -955,11 +996,13 @@ class UNiiEventRecord(UNiiData):
 
         data = data[10:]
 
+        # The descriptions and names below come from a small fixed set which repeats across
+        # events, interning them makes all records share the same string objects.
         # Description
         event_description_length = data[0]
         if event_description_length > 0:
-            self.event_description = decode_and_strip(
-                data[1 : 1 + event_description_length]
+            self.event_description = sys.intern(
+                decode_and_strip(data[1 : 1 + event_description_length])
             )
 
         data = data[1 + event_description_length :]
@@ -971,7 +1014,9 @@ class UNiiEventRecord(UNiiData):
 
         user_name_length = data[2]
         if user_name_length > 0:
-            self.user_name = decode_and_strip(data[3 : 3 + user_name_length])
+            self.user_name = sys.intern(
+                decode_and_strip(data[3 : 3 + user_name_length])
+            )
 
         data = data[3 + user_name_length :]
 
@@ -982,7 +1027,9 @@ class UNiiEventRecord(UNiiData):
 
         input_name_length = data[2]
         if input_name_length > 0:
-            self.input_name = decode_and_strip(data[3 : 3 + input_name_length])
+            self.input_name = sys.intern(
+                decode_and_strip(data[3 : 3 + input_name_length])
+            )
 
         data = data[3 + input_name_length :]
 
@@ -993,7 +1040,9 @@ class UNiiEventRecord(UNiiData):
 
         device_name_length = data[2]
         if device_name_length > 0:
-            self.device_name = decode_and_strip(data[3 : 3 + device_name_length])
+            self.device_name = sys.intern(
+                decode_and_strip(data[3 : 3 + device_name_length])
+            )
 
         data = data[3 + device_name_length :]
 
@@ -7,8 +7,9 @@ Only TCP/IP connections are supported, UDP connections are currently not impleme
 import asyncio
 import logging
 import random
+import socket
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
 from typing import Final
 
 from .task_helper import save_task_reference
@@ -54,9 +55,12 @@ class UNiiConnection(ABC):
 
     _MAX_LENGTH_OF_ANSWER: Final = 1500
 
-    last_message_sent: datetime = datetime.now()
-    last_message_received: datetime = datetime.now()
+    # Monotonic timestamps (time.monotonic()) of the last sent and received message, immune to
+    # wall-clock jumps and cheaper to compare than datetime objects.
+    last_message_sent: float = 0.0
+    last_message_received: float = 0.0
     _message_received_callback = None
+    _connection_closed_callback = None
     unique_id: str
 
     def set_message_received_callback(self, callback):
@@ -65,6 +69,12 @@ class UNiiConnection(ABC):
         """
         self._message_received_callback = callback
 
+    def set_connection_closed_callback(self, callback):
+        """
+        Sets the call back which is called when the connection is closed.
+        """
+        self._connection_closed_callback = callback
+
     @abstractmethod
     async def connect(self):
         """
@@ -144,6 +154,12 @@ class UNiiTCPConnection(UNiiConnection):
                 )
                 logger.info("Connected to %s", self)
 
+                # The traffic consists of small request/response and poll alive messages,
+                # disable Nagle's algorithm so they are not delayed to be coalesced.
+                sock = self._writer.get_extra_info("socket")
+                if sock is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
                 # Fixed session ID only one session
                 self._session_id = 0xFFFF
                 # Start with a random TX Sequence
@@ -176,6 +192,8 @@ class UNiiTCPConnection(UNiiConnection):
 
         if not self.is_open:
             logger.debug("Connection closed")
+            if self._connection_closed_callback is not None:
+                self._connection_closed_callback()
             return True
 
         logger.error("Failed to close connection")
@@ -222,7 +240,9 @@ class UNiiTCPConnection(UNiiConnection):
     async def _receive_coroutine(self):
         while self._reader is not None:
             try:
-                response = await asyncio.wait_for(self._reader.read(14), timeout=0.1)
+                response = bytearray(
+                    await asyncio.wait_for(self._reader.read(14), timeout=0.1)
+                )
                 if len(response) < 13:
                     continue
 
@@ -230,27 +250,32 @@ class UNiiTCPConnection(UNiiConnection):
                 packet_length = int.from_bytes(response[12:14])
 
                 # Read remaining part of the message
+                # Extending the bytearray in place avoids copying the already received part of
+                # the message on every read.
                 while len(response) < packet_length:
                     response += await self._reader.read(packet_length - len(response))
                     if len(response) < packet_length:
                         logger.debug("Response not yet fully received")
 
                 message = UNiiResponseMessage(response, self._shared_key)
-                if message.command not in [
-                    # UNiiCommand.CONNECTION_REQUEST_RESPONSE,
-                    UNiiCommand.POLL_ALIVE_RESPONSE,
-                    UNiiCommand.INPUT_STATUS_CHANGED,
-                    UNiiCommand.DEVICE_STATUS_CHANGED,
-                    UNiiCommand.RESPONSE_REQUEST_INPUT_ARRANGEMENT,
-                    UNiiCommand.RESPONSE_REQUEST_EQUIPMENT_INFORMATION,
-                ]:
-                    logger.debug("Received: 0x%s", response.hex())
-                    logger.debug("Received: %s", message)
-                else:
-                    logger.debug(
-                        "Received: %i, %s", message.rx_sequence, message.command
-                    )
-                self.last_message_received = datetime.now()
+                # Hex dumping the message is not for free, check upfront if debug logging is
+                # enabled at all.
+                if logger.isEnabledFor(logging.DEBUG):
+                    if message.command not in [
+                        # UNiiCommand.CONNECTION_REQUEST_RESPONSE,
+                        UNiiCommand.POLL_ALIVE_RESPONSE,
+                        UNiiCommand.INPUT_STATUS_CHANGED,
+                        UNiiCommand.DEVICE_STATUS_CHANGED,
+                        UNiiCommand.RESPONSE_REQUEST_INPUT_ARRANGEMENT,
+                        UNiiCommand.RESPONSE_REQUEST_EQUIPMENT_INFORMATION,
+                    ]:
+                        logger.debug("Received: 0x%s", response.hex())
+                        logger.debug("Received: %s", message)
+                    else:
+                        logger.debug(
+                            "Received: %i, %s", message.rx_sequence, message.command
+                        )
+                self.last_message_received = time.monotonic()
                 # logger.debug("Last message received: %s", self.last_message_sent)
                 if message.rx_sequence != self._tx_sequence:
                     logger.warning(
@@ -304,7 +329,7 @@ class UNiiTCPConnection(UNiiConnection):
                     async with self._writer_lock:
                         self._writer.write(message.to_bytes(self._shared_key))
                         await self._writer.drain()
-                        self.last_message_sent = datetime.now()
+                        self.last_message_sent = time.monotonic()
                         # logger.debug("Last message sent: %s", self.last_message_sent)
 
                     return message.tx_sequence
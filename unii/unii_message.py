@@ -4,17 +4,84 @@
 Messages used by the UNii library.
 """
 
+import binascii
 import logging
+import struct
 from enum import IntEnum
+from functools import lru_cache
 from typing import Final
 
 from Crypto.Cipher import AES
 
-from .unii_command import UNiiCommand
+from .unii_command import COMMANDS_BY_VALUE, UNiiCommand
 from .unii_command_data import *
 
 logger = logging.getLogger(__name__)
 
+# The message header: 2 byte Session ID, 4 byte TX Sequence, 4 byte RX Sequence, 1 byte
+# Protocol ID, 1 byte Packet Type and 2 byte Total Packet Length, all big endian.
+_HEADER: Final = struct.Struct(">HIIBBH")
+
+# Data classes used to parse the payload of received messages, keyed by command. Commands not
+# listed here fall back to UNiiRawData.
+_DATA_CLASSES: Final[dict[UNiiCommand, type]] = {
+    # Generic
+    UNiiCommand.GENERAL_RESPONSE: UNiiResultCode,
+    # Equipment related
+    UNiiCommand.RESPONSE_REQUEST_EQUIPMENT_INFORMATION: UNiiEquipmentInformation,
+    # Section related
+    UNiiCommand.RESPONSE_REQUEST_SECTION_ARRANGEMENT: UNiiSectionArrangement,
+    UNiiCommand.RESPONSE_REQUEST_SECTION_STATUS: UNiiSectionStatus,
+    UNiiCommand.RESPONSE_READY_TO_ARM_SECTIONS: UNiiReadyToArmSectionStatus,
+    UNiiCommand.RESPONSE_ARM_SECTION: UNiiArmSectionStatus,
+    UNiiCommand.RESPONSE_DISARM_SECTION: UNiiDisarmSectionStatus,
+    # Input related
+    UNiiCommand.RESPONSE_REQUEST_INPUT_ARRANGEMENT: UNiiInputArrangement,
+    UNiiCommand.INPUT_STATUS_CHANGED: UNiiInputStatus,
+    UNiiCommand.INPUT_STATUS_UPDATE: UNiiInputStatusUpdate,
+    UNiiCommand.RESPONSE_REQUEST_TO_BYPASS_AN_INPUT: UNiiBypassZoneInputResult,
+    UNiiCommand.RESPONSE_REQUEST_TO_UNBYPASS_AN_INPUT: UNiiUnbypassZoneInputResult,
+    # Output related
+    UNiiCommand.RESPONSE_REQUEST_OUTPUT_ARRANGEMENT: UNiiOutputArrangement,
+    # Device related
+    UNiiCommand.DEVICE_STATUS_CHANGED: UNiiDeviceStatus,
+    # Event related
+    UNiiCommand.EVENT_OCCURRED: UNiiEventRecord,
+}
+
+
+@lru_cache(maxsize=4)
+def _aes_cipher(shared_key: bytes):
+    """
+    Creates an AES cipher for the given shared key.
+
+    The cipher, and with it the expanded key schedule, is cached so consecutive messages
+    encrypted with the same shared key don't have to repeat the key setup.
+    """
+    return AES.new(shared_key, AES.MODE_ECB)
+
+
+def _aes_ctr_transform(shared_key: bytes, initial_value: bytes, data: bytes) -> bytes:
+    """
+    Encrypts or decrypts data in AES CTR mode using the cached cipher for the shared key.
+
+    In CTR mode encryption and decryption are the same operation: the data is XOR-ed with the
+    key stream generated by encrypting the consecutive counter blocks.
+    """
+    counter = int.from_bytes(initial_value)
+    n_blocks = (len(data) + 15) // 16
+    keystream = _aes_cipher(shared_key).encrypt(
+        b"".join((counter + block).to_bytes(16) for block in range(n_blocks))
+    )
+    return (int.from_bytes(data) ^ int.from_bytes(keystream[: len(data)])).to_bytes(
+        len(data)
+    )
+
+
+# For commands without data, like Connection Request and Poll Alive Request, the padded payload
+# is identical for every message and only has to be constructed once.
+_PAYLOAD_CACHE: dict["UNiiCommand", bytes] = {}
+
 
 class UNiiMessageError(Exception):
     """
@@ -123,19 +190,12 @@ class _UNiiMessage:
     def _calculate_crc16(self, message: bytes) -> int:
         """
         Calculates the CRC-16 checksum over the given message
+
+        The UNii checksum (polynomial 0x1021, init 0x0000, no reflection) is CRC-16/XMODEM,
+        for which binascii provides a C implementation.
         """
-        crc = self._CRC16_INIT
-        for _, byte in enumerate(message):
-            crc ^= byte << 8
-            for _ in range(8):
-                if (crc & 0x8000) > 0:
-                    crc <<= 1
-                    crc ^= self._CRC16_POLYNOMIAL
-                else:
-                    crc <<= 1
-        crc &= 0xFFFF
         # logger.debug("CRC-16 for 0x%s: %s", message.hex(), hex(crc))
-        return crc
+        return binascii.crc_hqx(message, self._CRC16_INIT)
 
     def __str__(self) -> str:
         return str(
@@ -173,26 +233,18 @@ class UNiiRequestMessage(_UNiiMessage):
         """
         Creates the header, first 14 bytes, of the message.
         """
-        header = bytearray()
-        # 2 byte Session ID
-        header += self.session_id.to_bytes(2)
-        # 4 byte Sequence number
-        header += self.tx_sequence.to_bytes(4)
-        # 4 byte Last received sequence number
-        header += self.rx_sequence.to_bytes(4)
-        # 1 byte Protocol ID
-        header += self._protocol_id.to_bytes(1)
-        # 1 byte Packet Type
-        if self.command < 0x0008:
-            header += UNiiPacketType.SESSION_SETUP.to_bytes(1)
-        else:
-            header += UNiiPacketType.NORMAL_CONECTION.to_bytes(1)
-        # 2 byte Total Packet Length
-        # To be replaced with the actual packet length once the total message is constructed.
-        header.append(0x00)
-        header.append(0x00)
-
-        return header
+        # The Total Packet Length is replaced with the actual packet length once the total
+        # message is constructed.
+        return bytearray(
+            _HEADER.pack(
+                self.session_id,
+                self.tx_sequence,
+                self.rx_sequence,
+                self._protocol_id,
+                self.packet_type,
+                0x0000,
+            )
+        )
 
     def _create_payload(self):
         """
@@ -215,6 +267,22 @@ class UNiiRequestMessage(_UNiiMessage):
 
         return payload
 
+    def _create_padded_payload(self) -> bytes:
+        """
+        Creates the payload of the message, padded to a multiple of 16 bytes for the total
+        message length.
+        """
+        payload = self._create_payload()
+
+        # Add Padding
+        packet_length = (
+            14 + len(payload) + 2
+        )  # Add 14 for the header and 2 for the Checksum
+        n_padding_bytes = 16 - (packet_length % 16)
+        payload += bytes(n_padding_bytes)
+
+        return bytes(payload)
+
     def to_bytes(self, shared_key: bytes | None = None) -> bytes:
         """
         Converts the UNii Message to a sequence of bytes
@@ -225,13 +293,14 @@ class UNiiRequestMessage(_UNiiMessage):
             self._protocol_id = UNiiProtocolID.BASIC_ENCRYPTION
 
         header = self._create_header()
-        payload = self._create_payload()
 
-        # Add Padding
-        packet_length = len(header) + len(payload) + 2  # Add 2 for the Checksum
-        n_padding_bytes = 16 - (packet_length % 16)
-        for _ in range(n_padding_bytes):
-            payload.append(0x00)
+        if self.data is None:
+            payload = _PAYLOAD_CACHE.get(self.command)
+            if payload is None:
+                payload = self._create_padded_payload()
+                _PAYLOAD_CACHE[self.command] = payload
+        else:
+            payload = self._create_padded_payload()
 
         if shared_key is not None:
             # logger.debug("Payload: 0x%s", payload.hex())
@@ -243,10 +312,7 @@ class UNiiRequestMessage(_UNiiMessage):
             initial_value += b"\00\00\00\00"
             # logger.debug("Initial value: 0x%s", initial_value.hex())
 
-            aes = AES.new(
-                shared_key, AES.MODE_CTR, initial_value=initial_value, nonce=b""
-            )
-            payload = aes.encrypt(payload)
+            payload = _aes_ctr_transform(shared_key, bytes(initial_value), payload)
             # logger.debug("Encrypted Payload: 0x%s", payload.hex())
 
         message = header + payload
@@ -278,13 +344,24 @@ class UNiiResponseMessage(_UNiiMessage):
         """ """
         assert message is not None
 
+        # Validate the frame before doing any decryption or parsing work, a message is at
+        # least a 14 byte header and a 2 byte checksum.
+        if len(message) < 16:
+            raise UNiiIncompleteMessageError(16, len(message))
+
         # First 14 bytes Header
         header = message[:14]
         payload = message[14:-2]
         checksum = message[-2:]
 
-        # Length
-        packet_length = int.from_bytes(header[12:14])
+        (
+            self.session_id,
+            self.tx_sequence,
+            self.rx_sequence,
+            protocol_id,
+            _packet_type,
+            packet_length,
+        ) = _HEADER.unpack_from(message)
 
         if packet_length != len(message):
             raise UNiiIncompleteMessageError(packet_length, len(message))
@@ -296,19 +373,8 @@ class UNiiResponseMessage(_UNiiMessage):
         if received_checksum != expected_checksum:
             raise UNiiChecksumError(expected_checksum, received_checksum)
 
-        # Session ID
-        self.session_id = int.from_bytes(header[:2])
-
-        # TX Sequence
-        self.tx_sequence = int.from_bytes(header[2:6])
-        # RX Sequence
-        self.rx_sequence = int.from_bytes(header[6:10])
         # Protocol ID
-        protocol_id = UNiiProtocolID(header[10])
-        # Packet Type
-        # packet_type = UNiiPacketType(header[11])
-        # Length
-        # message_length = int.from_bytes(header[11:13])
+        protocol_id = UNiiProtocolID(protocol_id)
 
         if protocol_id == UNiiProtocolID.BASIC_ENCRYPTION and shared_key is not None:
             # As Initialization Vector for the encryption the first 12 bytes of the header are used.
@@ -321,11 +387,9 @@ class UNiiResponseMessage(_UNiiMessage):
         # Command
         command = int.from_bytes(payload[:2])
 
-        try:
-            self.command = UNiiCommand(command)
-        except ValueError as ex:
-            logger.warning(ex)
-            self.command = None
+        self.command = COMMANDS_BY_VALUE.get(command)
+        if self.command is None:
+            logger.warning("%s is not a valid UNiiCommand", hex(command))
 
         # Data length
         data_length = int.from_bytes(payload[2:4])
@@ -336,46 +400,7 @@ class UNiiResponseMessage(_UNiiMessage):
             data = payload[4 : 4 + data_length]
             # logger.debug("%s data: %i bytes, 0x%s", self.command, len(data), data.hex())
             try:
-                match self.command:
-                    # Generic
-                    case UNiiCommand.GENERAL_RESPONSE:
-                        data = UNiiResultCode(data)
-                    # Equipment related
-                    case UNiiCommand.RESPONSE_REQUEST_EQUIPMENT_INFORMATION:
-                        data = UNiiEquipmentInformation(data)
-                    # Section related
-                    case UNiiCommand.RESPONSE_REQUEST_SECTION_ARRANGEMENT:
-                        data = UNiiSectionArrangement(data)
-                    case UNiiCommand.RESPONSE_REQUEST_SECTION_STATUS:
-                        data = UNiiSectionStatus(data)
-                    case UNiiCommand.RESPONSE_READY_TO_ARM_SECTIONS:
-                        data = UNiiReadyToArmSectionStatus(data)
-                    case UNiiCommand.RESPONSE_ARM_SECTION:
-                        data = UNiiArmSectionStatus(data)
-                    case UNiiCommand.RESPONSE_DISARM_SECTION:
-                        data = UNiiDisarmSectionStatus(data)
-                    # Input related
-                    case UNiiCommand.RESPONSE_REQUEST_INPUT_ARRANGEMENT:
-                        data = UNiiInputArrangement(data)
-                    case UNiiCommand.INPUT_STATUS_CHANGED:
-                        data = UNiiInputStatus(data)
-                    case UNiiCommand.INPUT_STATUS_UPDATE:
-                        data = UNiiInputStatusUpdate(data)
-                    case UNiiCommand.RESPONSE_REQUEST_TO_BYPASS_AN_INPUT:
-                        data = UNiiBypassZoneInputResult(data)
-                    case UNiiCommand.RESPONSE_REQUEST_TO_UNBYPASS_AN_INPUT:
-                        data = UNiiUnbypassZoneInputResult(data)
-                    # Output related
-                    case UNiiCommand.RESPONSE_REQUEST_OUTPUT_ARRANGEMENT:
-                        data = UNiiOutputArrangement(data)
-                    # Device related
-                    case UNiiCommand.DEVICE_STATUS_CHANGED:
-                        data = UNiiDeviceStatus(data)
-                    # Event related
-                    case UNiiCommand.EVENT_OCCURRED:
-                        data = UNiiEventRecord(data)
-                    case _:
-                        data = UNiiRawData(data)
+                data = _DATA_CLASSES.get(self.command, UNiiRawData)(data)
             except ValueError as ex:
                 data = None
                 if (
@@ -406,6 +431,4 @@ class UNiiResponseMessage(_UNiiMessage):
         self.data = data
 
     def _decrypt(self, shared_key: bytes, initial_value: bytes, payload: bytes):
-        aes = AES.new(shared_key, AES.MODE_CTR, initial_value=initial_value, nonce=b"")
-
-        return aes.decrypt(payload)
+        return _aes_ctr_transform(shared_key, bytes(initial_value), payload)